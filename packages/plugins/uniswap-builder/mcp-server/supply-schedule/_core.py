@@ -0,0 +1,140 @@
+"""Numeric kernel for the supply-schedule server.
+
+Shared by server.py and test_logic.py so there is exactly one copy of the
+schedule math; this module deliberately has no mcp dependency so the
+tests run without the server stack installed. The optional Numba and
+Cython accelerations both live here - apply future optimizations to this
+module only.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel also runs as plain Python
+    njit = None
+
+try:
+    # Compiled Cython kernel (see _schedule.pyx / setup.py); optional.
+    from _schedule import generate_schedule_c
+except ImportError:
+    generate_schedule_c = None
+
+# Total tokens minted over one auction, regardless of its duration.
+TOTAL_TARGET = 1_000_000_000
+
+# The ramp is split into this many segments of geometrically growing length.
+NUM_SEGMENTS = 10
+
+# Exponent of the cumulative-mint curve during the ramp.
+GROWTH_EXPONENT = 1.2
+
+# Ratio between the lengths of consecutive ramp segments.
+GROWTH_FACTOR = 1.35
+
+# Share of the auction (blocks and tokens) covered by the ramp; the rest
+# is the flat tail.
+RAMP_SHARE = 0.7
+
+# 4h, 12h, 24h, and 7d auctions at 1 block/s - the durations seen in
+# practice.
+STANDARD_DURATIONS = (14400, 43200, 86400, 604800)
+
+
+def _compute_schedule_arrays(auction_blocks: int):
+    """Compute (mps, blockDelta) arrays for the ramp segments plus tail.
+
+    Written as plain scalar loops so Numba can compile the whole kernel
+    (geometric durations, cumulative-mint curve, rounding) into one
+    machine-code function; without numba it runs unchanged as Python.
+    Durations sum exactly to the auction length - rounding drift is folded
+    into the final (longest) ramp segment.
+    """
+    blocks_for_segments = round(auction_blocks * RAMP_SHARE)
+    tail_blocks = auction_blocks - blocks_for_segments
+
+    geometric_sum = (math.pow(GROWTH_FACTOR, NUM_SEGMENTS) - 1.0) / (
+        GROWTH_FACTOR - 1.0
+    )
+    b0 = blocks_for_segments / geometric_sum
+
+    mps = np.empty(NUM_SEGMENTS + 1, dtype=np.int64)
+    deltas = np.empty(NUM_SEGMENTS + 1, dtype=np.int64)
+
+    # GROWTH_FACTOR**i as a running product: one multiply per segment
+    # instead of a pow call.
+    total = 0
+    r = 1.0
+    for i in range(NUM_SEGMENTS):
+        d = int(round(b0 * r))
+        if d < 1:
+            d = 1
+        deltas[i] = d
+        total += d
+        r *= GROWTH_FACTOR
+    deltas[NUM_SEGMENTS - 1] += blocks_for_segments - total
+
+    # math.pow is a direct C call for float exponents, vs the BINARY_POWER
+    # dispatch of ** when the kernel runs un-jitted.
+    scale = 0.7 * TOTAL_TARGET / math.pow(blocks_for_segments, GROWTH_EXPONENT)
+    prev_tokens = 0.0
+    end_block = 0
+    for i in range(NUM_SEGMENTS):
+        end_block += deltas[i]
+        end_tokens = scale * math.pow(end_block, GROWTH_EXPONENT)
+        m = int(round((end_tokens - prev_tokens) / deltas[i]))
+        mps[i] = m if m > 1 else 1
+        prev_tokens = end_tokens
+
+    tail_mps = int(round(0.3 * TOTAL_TARGET / tail_blocks))
+    mps[NUM_SEGMENTS] = tail_mps if tail_mps > 1 else 1
+    deltas[NUM_SEGMENTS] = tail_blocks
+    return mps, deltas
+
+
+if njit is not None:
+    _compute_schedule_arrays = njit(cache=True, fastmath=True)(
+        _compute_schedule_arrays
+    )
+
+
+def _generate_schedule_arrays(
+    auction_blocks: int, prebid_blocks: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Structure-of-arrays view of the schedule: (mps, blockDelta) int64 arrays.
+
+    Internal layout - callers reduce over the arrays directly and only
+    materialize per-segment dicts at the JSON boundary.
+    """
+    if generate_schedule_c is not None:
+        pairs = np.asarray(
+            generate_schedule_c(auction_blocks, prebid_blocks), dtype=np.int64
+        )
+        return pairs[:, 0], pairs[:, 1]
+
+    mps_arr, delta_arr = _compute_schedule_arrays(auction_blocks)
+    if prebid_blocks > 0:
+        mps_arr = np.concatenate(([0], mps_arr))
+        delta_arr = np.concatenate(([prebid_blocks], delta_arr))
+    return mps_arr, delta_arr
+
+
+@functools.lru_cache(maxsize=128)
+def generate_schedule(
+    auction_blocks: int, prebid_blocks: int = 0
+) -> tuple[tuple[tuple[int, int], ...], int]:
+    """Build the mint schedule for an auction of auction_blocks blocks.
+
+    Returns ((mps, blockDelta) tuples, total_minted) - the total comes out
+    of the same reduction that builds the schedule, so callers never need a
+    second pass. Per-segment rounding keeps total_minted within 1e-3 of
+    TOTAL_TARGET. The schedule is deterministic and the input space is
+    small (a handful of standard durations), so results are memoized; the
+    immutable tuple form keeps cached values safe to share.
+    """
+    mps_arr, delta_arr = _generate_schedule_arrays(auction_blocks, prebid_blocks)
+    total = int((mps_arr * delta_arr).sum())
+    return tuple(zip(mps_arr.tolist(), delta_arr.tolist())), total
@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of the supply-schedule kernel.
+
+Optional: server.py falls back to the Numba/Python kernel when this
+extension is not compiled. Build in place with:
+
+    python3 setup.py build_ext --inplace
+
+Uses libc rint (round-half-to-even, like Python's round) so schedules
+are identical to the interpreted kernel. Keep the constants and math in
+sync with _core.py.
+"""
+
+from libc.math cimport pow, rint
+
+cdef double TOTAL_TARGET = 1_000_000_000.0
+cdef int NUM_SEGMENTS = 10
+cdef double GROWTH_EXPONENT = 1.2
+cdef double GROWTH_FACTOR = 1.35
+cdef double RAMP_SHARE = 0.7
+
+
+cpdef list generate_schedule_c(int auction_blocks, int prebid_blocks):
+    cdef int blocks_for_segments = <int>rint(auction_blocks * RAMP_SHARE)
+    cdef int tail_blocks = auction_blocks - blocks_for_segments
+    cdef double geometric_sum = (
+        pow(GROWTH_FACTOR, NUM_SEGMENTS) - 1.0
+    ) / (GROWTH_FACTOR - 1.0)
+    cdef double b0 = blocks_for_segments / geometric_sum
+
+    cdef long long[11] deltas
+    cdef long long[11] mps
+    cdef int i
+    cdef long long d, m, total = 0, end_block = 0
+    cdef double r = 1.0, prev_tokens = 0.0, end_tokens, scale
+
+    for i in range(NUM_SEGMENTS):
+        d = <long long>rint(b0 * r)
+        if d < 1:
+            d = 1
+        deltas[i] = d
+        total += d
+        r *= GROWTH_FACTOR
+    deltas[NUM_SEGMENTS - 1] += blocks_for_segments - total
+
+    scale = 0.7 * TOTAL_TARGET / pow(blocks_for_segments, GROWTH_EXPONENT)
+    for i in range(NUM_SEGMENTS):
+        end_block += deltas[i]
+        end_tokens = scale * pow(<double>end_block, GROWTH_EXPONENT)
+        m = <long long>rint((end_tokens - prev_tokens) / deltas[i])
+        mps[i] = m if m > 1 else 1
+        prev_tokens = end_tokens
+
+    m = <long long>rint(0.3 * TOTAL_TARGET / tail_blocks)
+    mps[NUM_SEGMENTS] = m if m > 1 else 1
+    deltas[NUM_SEGMENTS] = tail_blocks
+
+    cdef list schedule = []
+    if prebid_blocks > 0:
+        schedule.append((0, prebid_blocks))
+    for i in range(NUM_SEGMENTS + 1):
+        schedule.append((mps[i], deltas[i]))
+    return schedule
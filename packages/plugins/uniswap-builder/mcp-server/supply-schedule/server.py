@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Supply-schedule MCP server.
+
+Exposes a single `generate_schedule` tool that turns an auction duration
+(in blocks) into a piecewise-constant token mint schedule: a list of
+`{"mps": <mint per slot>, "blockDelta": <segment length in blocks>}`
+entries. The first 70% of the mint target ramps up along an x^1.2 curve
+across geometrically growing segments; the remaining 30% is minted at a
+flat rate over the tail of the auction.
+
+The schedule math lives in _core.py (shared with the tests); this module
+only carries the MCP plumbing.
+"""
+
+import asyncio
+import json
+import logging
+import os
+
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import TextContent, Tool
+from pydantic import BaseModel, Field
+
+from _core import STANDARD_DURATIONS, TOTAL_TARGET, generate_schedule
+
+try:
+    import uvloop
+except ImportError:  # optional C-accelerated event loop
+    uvloop = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("supply-schedule")
+
+
+class GenerateScheduleInput(BaseModel):
+    """Input schema for the generate_schedule tool.
+
+    Only used to publish the tool's inputSchema; call_tool validates the
+    two integers by hand to avoid per-call model construction.
+    """
+
+    auction_blocks: int = Field(..., gt=0, description="Auction duration in blocks")
+    prebid_blocks: int = Field(
+        0, ge=0, description="Blocks before the auction starts minting"
+    )
+
+
+# Warm the memoized schedule for the standard auction durations at import
+# so the common case never pays the kernel (or its JIT compile) at
+# request time.
+for _blocks in STANDARD_DURATIONS:
+    generate_schedule(_blocks)
+
+
+server = Server("supply-schedule")
+
+# The response is consumed by an LLM, so indentation adds nothing;
+# compact separators keep json.dumps on its C-accelerated path. Set
+# SUPPLY_SCHEDULE_DEBUG=1 for human-readable output while debugging.
+_JSON_KWARGS = (
+    {"indent": 2}
+    if os.environ.get("SUPPLY_SCHEDULE_DEBUG")
+    else {"separators": (",", ":")}
+)
+
+# Finished JSON responses keyed by (auction_blocks, prebid_blocks); the
+# output is a pure function of the inputs, so repeat calls can skip
+# everything after input validation.
+_response_cache: dict[tuple[int, int], str] = {}
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return [
+        Tool(
+            name="generate_schedule",
+            description=(
+                "Generate a token supply schedule for an auction. Returns a list "
+                "of {mps, blockDelta} segments ramping along an x^1.2 curve."
+            ),
+            inputSchema=GenerateScheduleInput.model_json_schema(),
+        )
+    ]
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    try:
+        if name != "generate_schedule":
+            raise ValueError(f"Unknown tool: {name}")
+
+        auction_blocks = arguments["auction_blocks"]
+        prebid_blocks = arguments.get("prebid_blocks", 0)
+        if not isinstance(auction_blocks, int) or auction_blocks <= 0:
+            raise ValueError("auction_blocks must be a positive integer")
+        if not isinstance(prebid_blocks, int) or prebid_blocks < 0:
+            raise ValueError("prebid_blocks must be a non-negative integer")
+
+        key = (auction_blocks, prebid_blocks)
+        cached_text = _response_cache.get(key)
+        if cached_text is not None:
+            return [TextContent(type="text", text=cached_text)]
+
+        cached, total_mps = generate_schedule(auction_blocks, prebid_blocks)
+        # The dict-per-segment shape only exists for the JSON output; the
+        # schedule stays (mps, blockDelta) tuples everywhere else.
+        output = {
+            "schedule": [{"mps": m, "blockDelta": d} for m, d in cached],
+            "summary": {
+                "auctionBlocks": auction_blocks,
+                "prebidBlocks": prebid_blocks,
+                "segments": len(cached),
+                "totalMinted": total_mps,
+                "target": TOTAL_TARGET,
+            },
+        }
+        text = json.dumps(output, **_JSON_KWARGS)
+        _response_cache[key] = text
+        return [TextContent(type="text", text=text)]
+    except ValueError as e:
+        # Expected for bad input or an unknown tool name; no point
+        # formatting a traceback for these.
+        logger.warning("Invalid request for %s: %s", name, e)
+        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+    except Exception as e:
+        logger.error("Error handling %s: %s", name, e, exc_info=True)
+        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+
+
+async def main():
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream, write_stream, server.create_initialization_options()
+        )
+
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
@@ -0,0 +1,23 @@
+"""Build the optional Cython schedule kernel.
+
+    python3 setup.py build_ext --inplace
+
+-O3 with -ffp-contract=on keeps rounding reproducible (deliberately not
+-Ofast / -march=native, which can change float results across hosts).
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=cythonize(
+        [
+            Extension(
+                "_schedule",
+                ["_schedule.pyx"],
+                extra_compile_args=["-O3", "-ffp-contract=on"],
+            )
+        ],
+        language_level=3,
+    )
+)
@@ -0,0 +1,53 @@
+"""Tests for the supply-schedule math in _core.py.
+
+_core has no mcp dependency, so these tests exercise the exact kernel the
+server ships (including the optional Numba/Cython accelerations when
+present) without the server stack installed.
+"""
+
+import pytest
+from _core import (
+    NUM_SEGMENTS,
+    STANDARD_DURATIONS,
+    TOTAL_TARGET,
+    _generate_schedule_arrays,
+    generate_schedule,
+)
+
+
+@pytest.mark.parametrize("total_blocks", [100, 10080, 423360])
+def test_ramp_durations_grow(total_blocks):
+    _, deltas = _generate_schedule_arrays(total_blocks)
+    ramp = deltas[:NUM_SEGMENTS].tolist()
+    assert all(d >= 1 for d in ramp)
+    assert ramp == sorted(ramp)
+
+
+@pytest.mark.parametrize("auction_blocks", STANDARD_DURATIONS)
+def test_schedule_covers_auction(auction_blocks):
+    schedule, _ = generate_schedule(auction_blocks)
+    assert len(schedule) == NUM_SEGMENTS + 1
+    assert sum(delta for _, delta in schedule) == auction_blocks
+
+
+@pytest.mark.parametrize("auction_blocks", STANDARD_DURATIONS)
+def test_total_minted_close_to_target(auction_blocks):
+    schedule, total = generate_schedule(auction_blocks)
+    assert total == sum(mps * delta for mps, delta in schedule)
+    assert abs(total - TOTAL_TARGET) / TOTAL_TARGET < 1e-3
+
+
+@pytest.mark.parametrize("auction_blocks", STANDARD_DURATIONS)
+def test_mps_positive_after_prebid(auction_blocks):
+    schedule, _ = generate_schedule(auction_blocks)
+    assert all(mps >= 1 for mps, _ in schedule)
+
+
+def test_prebid_prepends_zero_mint_segment():
+    schedule, _ = generate_schedule(86400, prebid_blocks=600)
+    assert schedule[0] == (0, 600)
+    assert sum(delta for _, delta in schedule) == 86400 + 600
+
+
+def test_generate_schedule_is_memoized():
+    assert generate_schedule(14400) is generate_schedule(14400)